@@ -1,22 +1,55 @@
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import create_engine
 from sqlmodel.ext.asyncio.session import AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker
 from .settings import settings
 import redis
 
 
-engine = AsyncEngine(create_engine(settings.DATABASE_URL, echo=True, future=True))
+def _connect_args() -> dict:
+    """
+    Driver specific connection arguments.
 
-redis_connection = redis.Redis.from_url(settings.REDIS_URL)
+    asyncpg keeps a per-connection cache of prepared statements, so the
+    lookup queries are parsed and planned once per pooled connection.
+    """
+    if settings.DATABASE_URL and "+asyncpg" in settings.DATABASE_URL:
+        return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return {}
+
+
+engine = AsyncEngine(
+    create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DB_ECHO,
+        future=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args(),
+    )
+)
+
+# Shares the pool of ``engine`` but runs every transaction as READ ONLY.
+read_only_engine = engine.execution_options(postgresql_readonly=True)
 
+async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+read_only_session = sessionmaker(
+    read_only_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
 
-async def init_db():
-    async with engine.begin() as conn:
-        # await conn.run_sync(SQLModel.metadata.drop_all)
-        await conn.run_sync(SQLModel.metadata.create_all)
+redis_connection = redis.Redis.from_url(settings.REDIS_URL)
 
 
 async def get_session() -> AsyncSession:
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with async_session() as session:
         yield session
+
+
+async def get_read_only_session() -> AsyncSession:
+    async with read_only_session() as session:
+        yield session
@@ -16,3 +16,7 @@ class DataTransformationError(Exception):
 
 class DatabaseError(Exception):
     pass
+
+
+class RecognitionQueueFull(Exception):
+    pass
@@ -1,24 +1,100 @@
 import ast
 import logging
-from pytube import YouTube
-from pytube.exceptions import PytubeError
+from functools import partial
+from typing import Tuple
 from pydantic import BaseModel
-from fastapi import Depends, FastAPI, BackgroundTasks, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.encoders import jsonable_encoder
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.db import get_session
+from app.db import async_session, read_only_session as lookup_session
+from app.db import get_session, get_read_only_session
 from app.db import redis_connection
 from app.models import YoutubeMetadata, ShazamMetadata
 from app.services.youtube import YoutubeMetadataTransformer
 from app.services.service import handle_download_and_recognize
+from app.services.scheduler import Lane, RecognitionScheduler
 from app.settings import settings
-from app.exceptions import DatabaseError
+from app.exceptions import DatabaseError, RecognitionQueueFull
 
 
 app = FastAPI()
 
 logger = logging.getLogger(__name__)
 
+recognition_scheduler = RecognitionScheduler(
+    workers=settings.RECOGNITION_WORKERS,
+    interactive_weight=settings.RECOGNITION_INTERACTIVE_WEIGHT,
+    deadlines={
+        Lane.INTERACTIVE: settings.RECOGNITION_INTERACTIVE_DEADLINE,
+        Lane.BULK: settings.RECOGNITION_BULK_DEADLINE,
+    },
+    max_depths={
+        Lane.INTERACTIVE: settings.RECOGNITION_INTERACTIVE_MAX_DEPTH,
+        Lane.BULK: settings.RECOGNITION_BULK_MAX_DEPTH,
+    },
+    interactive_client_limit=settings.RECOGNITION_INTERACTIVE_CLIENT_LIMIT,
+)
+
+# API key -> (client ID, lane), validated at startup
+recognition_clients = {
+    api_key: (client_id, Lane(lane))
+    for api_key, (client_id, lane) in settings.RECOGNITION_CLIENTS.items()
+}
+
+
+@app.on_event("startup")
+async def start_recognition_scheduler() -> None:
+    recognition_scheduler.start()
+
+
+@app.on_event("shutdown")
+async def stop_recognition_scheduler() -> None:
+    await recognition_scheduler.stop(settings.RECOGNITION_SHUTDOWN_TIMEOUT)
+
+
+def identify_client(request: Request) -> Tuple[str, Lane]:
+    """
+    Identify the client of a request and the lane its recognition jobs use.
+
+    Clients with a configured API key get the lane configured for them.
+    Anyone else is identified by address, as resolved by uvicorn from the
+    proxy headers it trusts, and uses the interactive lane.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Tuple[str, Lane]: The client ID and the lane of its jobs.
+    """
+    if client := recognition_clients.get(request.headers.get("x-api-key")):
+        return client
+    return request.client.host if request.client else "anonymous", Lane.INTERACTIVE
+
+
+async def download_and_recognize(youtube_url: str, video_id: str) -> None:
+    """
+    Run the recognition with its own database sessions, as scheduled jobs
+    outlive the request that submitted them.
+
+    Only the URL and video ID wait in the queue, the YouTube object and the
+    metadata are loaded once the job runs. The lookup session is closed
+    before the slow work starts.
+
+    Args:
+        youtube_url (str): The URL of the YouTube video.
+        video_id (str): The ID of the YouTube video.
+    """
+    from pytube import YouTube
+
+    async with lookup_session() as session:
+        youtube_metadata = await session.get(YoutubeMetadata, video_id)
+    if not youtube_metadata:
+        logger.error(f"No YouTube metadata found for {video_id}")
+        return
+    await handle_download_and_recognize(
+        YouTube(youtube_url), youtube_metadata, async_session
+    )
+
 
 class YoutubeResponse(BaseModel):
     title: str
@@ -29,16 +105,18 @@ class YoutubeResponse(BaseModel):
 @app.get("/url/", response_model=YoutubeResponse)
 async def youtube_url(
     youtube_url: str,
-    background_tasks: BackgroundTasks,
+    request: Request,
     session: AsyncSession = Depends(get_session),
+    read_only_session: AsyncSession = Depends(get_read_only_session),
 ) -> YoutubeResponse:
     """
     Process a YouTube URL to extract metadata and initiate recognition.
 
     Args:
         youtube_url (str): The URL of the YouTube video.
-        background_tasks (BackgroundTasks): Asynchronous background task manager.
+        request (Request): The incoming request, used to identify the client.
         session (AsyncSession): Asynchronous database session.
+        read_only_session (AsyncSession): Read-only database session for lookups.
 
     Returns:
         YoutubeResponse: The extracted YoutubeMetadata.
@@ -48,6 +126,11 @@ async def youtube_url(
             return ast.literal_eval(cache.decode("utf-8"))
     except Exception as e:
         logger.error(f"An error occurred while fetching redis cache: {str(e)}")
+
+    # Imported here so cache hits never load the media stack
+    from pytube import YouTube
+    from pytube.exceptions import PytubeError
+
     try:
         youtube_object = YouTube(youtube_url)
     except PytubeError as e:
@@ -63,13 +146,20 @@ async def youtube_url(
 
     try:
         # Check if metadata for the YouTube video already exists in the database
-        youtube_metadata = await session.get(YoutubeMetadata, youtube_object.video_id)
-        shazam_metadata = await session.get(ShazamMetadata, youtube_object.video_id)
+        youtube_metadata = await read_only_session.get(
+            YoutubeMetadata, youtube_object.video_id
+        )
+        shazam_metadata = await read_only_session.get(
+            ShazamMetadata, youtube_object.video_id
+        )
     except DatabaseError as e:
         logger.error(e)
         raise HTTPException(
             status_code=500, detail="An unexpected error occurred"
         ) from e
+    finally:
+        # Return the lookup connection to the pool before any slow work starts
+        await read_only_session.close()
 
     if not youtube_metadata:
         # If YouTube metadata doesn't exist, transform and save it to the database
@@ -86,12 +176,19 @@ async def youtube_url(
             ) from e
 
     if not shazam_metadata:
-        background_tasks.add_task(
-            handle_download_and_recognize,
-            youtube_object,
-            youtube_metadata,
-            session,
-        )
+        client_id, lane = identify_client(request)
+        try:
+            recognition_scheduler.submit(
+                partial(download_and_recognize, youtube_url, youtube_metadata.id),
+                video_id=youtube_metadata.id,
+                client_id=client_id,
+                lane=lane,
+            )
+        except RecognitionQueueFull as e:
+            logger.warning(e)
+            raise HTTPException(
+                status_code=503, detail="Too many songs waiting, please retry later"
+            ) from e
     try:
         redis_json_data = jsonable_encoder(youtube_metadata)
         redis_connection.set(youtube_url, str(redis_json_data))
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+
+
+class AudioBufferPool:
+    """
+    A pool of reusable audio buffers bounded by a global memory budget.
+
+    Buffers are allocated on first use and recycled afterwards, so an idle
+    process holds no audio memory. Once every buffer is in use, new jobs
+    wait for one to be released instead of allocating more.
+    """
+
+    def __init__(self, buffer_size: int, memory_budget: int) -> None:
+        """
+        Initialize the AudioBufferPool instance.
+
+        Args:
+            buffer_size (int): Size in bytes of every buffer.
+            memory_budget (int): Total bytes the pool may hold, at least one
+            buffer is always available.
+        """
+        self.buffer_size = buffer_size
+        self.capacity = max(memory_budget // buffer_size, 1)
+        self._free: List[bytearray] = []
+        self._available = asyncio.Semaphore(self.capacity)
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """
+        Run ``func(*args, buffer)`` in a thread with a borrowed buffer,
+        waiting while the memory budget is exhausted.
+
+        The buffer goes back to the pool only once the thread is done, even
+        if the caller is cancelled while the thread still writes into it.
+
+        Args:
+            func (Callable[..., T]): Blocking function using the buffer, its
+            previous content is not cleared.
+            *args: Arguments passed to the function before the buffer.
+
+        Returns:
+            T: The result of the function.
+        """
+        await self._available.acquire()
+        buffer = self._free.pop() if self._free else bytearray(self.buffer_size)
+        task = asyncio.ensure_future(asyncio.to_thread(func, *args, buffer))
+
+        def release(task: asyncio.Future) -> None:
+            if not task.cancelled():
+                task.exception()  # Retrieved by the caller unless it was cancelled
+            self._free.append(buffer)
+            self._available.release()
+
+        task.add_done_callback(release)
+        return await asyncio.shield(task)
@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Awaitable, Callable, Deque, Dict, List
+from app.exceptions import RecognitionQueueFull
+
+logger = logging.getLogger(__name__)
+
+
+class Lane(str, Enum):
+    """
+    Scheduling lanes for recognition jobs.
+    """
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+class RecognitionJob:
+    """
+    A unit of recognition work waiting in the scheduler.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[], Awaitable[None]],
+        video_id: str,
+        client_id: str,
+        lane: Lane,
+        deadline: float,
+    ) -> None:
+        """
+        Initialize the RecognitionJob instance.
+
+        Args:
+            run (Callable[[], Awaitable[None]]): Coroutine factory doing the work.
+            video_id (str): YouTube video ID the job recognizes.
+            client_id (str): Identifier of the client that submitted the job.
+            lane (Lane): Lane the job is queued in.
+            deadline (float): Monotonic time after which the job is dropped.
+        """
+        self.run = run
+        self.video_id = video_id
+        self.client_id = client_id
+        self.lane = lane
+        self.deadline = deadline
+        self.enqueued_at = time.monotonic()
+        self.cancelled = False
+
+
+class FairQueue:
+    """
+    A queue serving its clients in round-robin order, so a single client
+    with many jobs cannot starve the others.
+    """
+
+    def __init__(self) -> None:
+        self._clients: "OrderedDict[str, Deque[RecognitionJob]]" = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def pending(self, client_id: str) -> int:
+        return len(self._clients.get(client_id, ()))
+
+    def push(self, job: RecognitionJob) -> None:
+        self._clients.setdefault(job.client_id, deque()).append(job)
+        self._size += 1
+
+    def pop(self) -> RecognitionJob:
+        client_id, jobs = self._clients.popitem(last=False)
+        job = jobs.popleft()
+        if jobs:
+            # Move the client to the back of the rotation
+            self._clients[client_id] = jobs
+        self._size -= 1
+        return job
+
+    def clear(self) -> List[RecognitionJob]:
+        jobs = [job for client_jobs in self._clients.values() for job in client_jobs]
+        self._clients.clear()
+        self._size = 0
+        return jobs
+
+
+class RecognitionScheduler:
+    """
+    A priority-aware scheduler running recognition jobs on a fixed pool of
+    workers.
+
+    Interactive jobs are preferred over bulk ones, while bulk still gets one
+    slot every ``interactive_weight`` jobs under saturation. Within a lane,
+    clients are served fairly. A client with too many interactive jobs
+    waiting is moved to the bulk lane. Jobs past their deadline are dropped
+    instead of being run.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        interactive_weight: int,
+        deadlines: Dict[Lane, float],
+        max_depths: Dict[Lane, int],
+        interactive_client_limit: int,
+    ) -> None:
+        """
+        Initialize the RecognitionScheduler instance.
+
+        Args:
+            workers (int): Number of jobs run concurrently.
+            interactive_weight (int): Interactive jobs run for every bulk job
+            when both lanes have work.
+            deadlines (Dict[Lane, float]): Seconds a job may wait per lane.
+            max_depths (Dict[Lane, int]): Jobs a lane may hold.
+            interactive_client_limit (int): Interactive jobs a client may have
+            waiting before its next ones go to the bulk lane.
+        """
+        self.workers = workers
+        self.interactive_weight = interactive_weight
+        self.deadlines = deadlines
+        self.max_depths = max_depths
+        self.interactive_client_limit = interactive_client_limit
+        self._lanes = {lane: FairQueue() for lane in Lane}
+        self._queued: Dict[str, RecognitionJob] = {}
+        self._pending = asyncio.Semaphore(0)
+        self._interactive_streak = 0
+        self._unfinished = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+
+    def submit(
+        self,
+        run: Callable[[], Awaitable[None]],
+        video_id: str,
+        client_id: str,
+        lane: Lane = Lane.INTERACTIVE,
+    ) -> bool:
+        """
+        Queue a recognition job.
+
+        A video already waiting in the queue is not queued twice, unless it
+        waits in the bulk lane and is now requested interactively, in which
+        case it is promoted if the interactive lane has room. Interactive
+        jobs of a client that already has ``interactive_client_limit`` of
+        them waiting go to the bulk lane.
+
+        Args:
+            run (Callable[[], Awaitable[None]]): Coroutine factory doing the work.
+            video_id (str): YouTube video ID the job recognizes.
+            client_id (str): Identifier of the client that submitted the job.
+            lane (Lane): Lane to queue the job in.
+
+        Returns:
+            bool: True if the job was queued, False if it was already queued.
+
+        Raises:
+            RecognitionQueueFull: If the lane already holds its maximum depth.
+        """
+        if (
+            lane is Lane.INTERACTIVE
+            and self._lanes[lane].pending(client_id) >= self.interactive_client_limit
+        ):
+            lane = Lane.BULK
+
+        queued = self._queued.get(video_id)
+        if queued and not (queued.lane is Lane.BULK and lane is Lane.INTERACTIVE):
+            return False
+        if len(self._lanes[lane]) >= self.max_depths[lane]:
+            if queued:
+                # Not promoted, it still runs from the bulk lane
+                return False
+            raise RecognitionQueueFull(f"The {lane.value} recognition lane is full.")
+        if queued:
+            queued.cancelled = True
+
+        job = RecognitionJob(
+            run, video_id, client_id, lane, time.monotonic() + self.deadlines[lane]
+        )
+        self._queued[video_id] = job
+        self._lanes[lane].push(job)
+        self._unfinished += 1
+        self._idle.clear()
+        self._pending.release()
+        return True
+
+    def start(self) -> None:
+        """
+        Start the worker tasks on the running event loop.
+        """
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: float) -> None:
+        """
+        Abandon the queued jobs and let the running ones finish, cancelling
+        those still running after the timeout.
+
+        Args:
+            timeout (float): Seconds to wait for running jobs.
+        """
+        self._closing = True
+        abandoned = 0
+        for lane in self._lanes.values():
+            for job in lane.clear():
+                abandoned += not job.cancelled
+                self._task_done()
+        self._queued.clear()
+        if abandoned:
+            logger.warning(f"Abandoned {abandoned} queued recognition jobs")
+
+        # Wake up the idle workers so they can exit
+        for _ in self._tasks:
+            self._pending.release()
+        if not self._tasks:
+            return
+        _, running = await asyncio.wait(self._tasks, timeout=timeout)
+        if running:
+            logger.warning(f"Cancelled {len(running)} running recognition jobs")
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self) -> None:
+        """
+        Wait until every queued job has been run or dropped.
+        """
+        await self._idle.wait()
+
+    def _next_job(self) -> RecognitionJob:
+        interactive = self._lanes[Lane.INTERACTIVE]
+        bulk = self._lanes[Lane.BULK]
+        if interactive and (
+            not bulk or self._interactive_streak < self.interactive_weight
+        ):
+            self._interactive_streak += 1
+            return interactive.pop()
+        self._interactive_streak = 0
+        return bulk.pop()
+
+    def _task_done(self) -> None:
+        self._unfinished -= 1
+        if not self._unfinished:
+            self._idle.set()
+
+    async def _worker(self) -> None:
+        while True:
+            await self._pending.acquire()
+            if self._closing:
+                return
+            job = self._next_job()
+            if self._queued.get(job.video_id) is job:
+                del self._queued[job.video_id]
+            try:
+                if job.cancelled:
+                    continue
+                if time.monotonic() > job.deadline:
+                    logger.warning(
+                        f"Dropped {job.lane.value} recognition job for "
+                        f"{job.video_id} after waiting past its deadline"
+                    )
+                    continue
+                await job.run()
+            except Exception as e:
+                logger.error(f"An unexpected error occurred: {str(e)}")
+            finally:
+                self._task_done()
@@ -1,12 +1,11 @@
 import logging
-from io import BytesIO
-from pydub import AudioSegment
-from pytube import YouTube
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict, TYPE_CHECKING
+from .buffers import AudioBufferPool
 from .youtube import YoutubeAudioDownloader
 from .shazam import ShazamAudioRecognizer, ShazamMetadataTransformer
 from app.models import ShazamMetadata, YoutubeMetadata
+from app.settings import settings
 from app.exceptions import (
     DataTransformationError,
     DatabaseError,
@@ -14,26 +13,44 @@ from app.exceptions import (
     DownloadError,
 )
 
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+    from pytube import YouTube
+
 logger = logging.getLogger(__name__)
 
+audio_buffer_pool = AudioBufferPool(
+    settings.AUDIO_BUFFER_SIZE, settings.AUDIO_MEMORY_BUDGET
+)
+
 
 async def handle_download_and_recognize(
-    youtube_object: YouTube, youtube_metadata: YoutubeMetadata, session: AsyncSession
+    youtube_object: "YouTube",
+    youtube_metadata: YoutubeMetadata,
+    session_factory: Callable[[], AsyncSession],
 ) -> None:
     """
     Handle the process of downloading YouTube audio, recognizing it using Shazam,
     and saving the Shazam metadata.
 
+    No database session is open while downloading and recognizing, one is
+    opened only to save the result.
+
     Args:
         youtube_object (YouTube): YouTube object containing video details.
         youtube_metadata (YoutubeMetadata): Metadata of the YouTube video.
-        session (AsyncSession): Asynchronous database session.
+        session_factory (Callable[[], AsyncSession]): Factory of asynchronous
+        database sessions.
     """
     try:
-        youtube_audio = download_youtube_audio(youtube_object)
+        # Downloading and decoding block, they run in a thread
+        youtube_audio = await audio_buffer_pool.run(
+            download_youtube_audio, youtube_object
+        )
         logger.info(f"Downloaded youtube audio: {youtube_audio}")
         shazam_response = await recognize_audio(youtube_audio)
-        await save_shazam_metadata(shazam_response, youtube_metadata, session)
+        async with session_factory() as session:
+            await save_shazam_metadata(shazam_response, youtube_metadata, session)
     except DownloadError as e:
         logger.error(e)
     except RecognizeError as e:
@@ -46,26 +63,30 @@ async def handle_download_and_recognize(
         logger.error(f"An unexpected error occurred: {str(e)}")
 
 
-def download_youtube_audio(youtube_object: YouTube) -> Optional[AudioSegment]:
+def download_youtube_audio(
+    youtube_object: "YouTube", buffer: Optional[bytearray] = None
+) -> Optional["AudioSegment"]:
     """
     Download and process audio from a YouTube video.
 
     Args:
         youtube_object (YouTube): YouTube object containing video details.
+        buffer (Optional[bytearray]): Buffer to download into, usually borrowed
+        from the audio buffer pool. A new one is allocated if not given.
 
     Returns:
         AudioSegment:
         Instance of AudioSegment or None if unsuccessful.
     """
-    buffer = BytesIO()
+    if buffer is None:
+        buffer = bytearray(settings.AUDIO_BUFFER_SIZE)
     youtube_audio = YoutubeAudioDownloader(youtube_object, buffer)
     youtube_audio.download_audio()
     youtube_audio.convert_to_audio_segment()
-    buffer.close()
     return youtube_audio.audio_segment
 
 
-async def recognize_audio(audio_segment: AudioSegment) -> Optional[Dict]:
+async def recognize_audio(audio_segment: "AudioSegment") -> Optional[Dict]:
     """
     Recognize audio using Shazam.
 
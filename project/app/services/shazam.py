@@ -1,15 +1,16 @@
-from shazamio import Shazam
-from pydub import AudioSegment
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 from app.exceptions import RecognizeError, DataTransformationError
 
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
 
 class ShazamAudioRecognizer:
     """
     A class to perform audio recognition using the Shazam service.
     """
 
-    def __init__(self, audio_segment: AudioSegment) -> None:
+    def __init__(self, audio_segment: "AudioSegment") -> None:
         """
         Initialize the ShazamAudioRecognizer instance.
 
@@ -27,6 +28,8 @@ class ShazamAudioRecognizer:
         Raises:
             RecognizeError: If an error occurs during audio recognition.
         """
+        from shazamio import Shazam
+
         try:
             shazam = Shazam()
             song = await shazam.recognize_song(self.audio_segment)
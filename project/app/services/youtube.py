@@ -1,56 +1,102 @@
 import logging
-from pytube import YouTube
-from pytube.exceptions import PytubeError
-from pydub import AudioSegment
-from typing import Dict
-from io import BytesIO
+import subprocess
+from typing import BinaryIO, Dict, TYPE_CHECKING
+from urllib.request import Request, urlopen
 from app.exceptions import DownloadError, YoutubeAudioNotFound, DataTransformationError
+from app.settings import settings
+
+if TYPE_CHECKING:
+    # The media stack is imported lazily so the API process only pays for it
+    # once a request misses the cache.
+    from pytube import YouTube
+    from pydub import AudioSegment
 
 logger = logging.getLogger(__name__)
 
+# Shazam fingerprints 16kHz mono audio, decoding straight to it keeps the
+# PCM of the recognition window small.
+AUDIO_FRAME_RATE = 16000
+AUDIO_CHANNELS = 1
+AUDIO_SAMPLE_WIDTH = 2
+
+# Same headers pytube sends to the stream URLs
+DOWNLOAD_HEADERS = {"User-Agent": "Mozilla/5.0", "accept-language": "en-US,en"}
+DOWNLOAD_TIMEOUT = 30  # seconds
+READ_CHUNK_SIZE = 64 * 1024  # bytes
+
 
 class YoutubeAudioDownloader:
     """
     A class to download and process audio from a YouTube video.
     """
 
-    def __init__(self, youtube_object: YouTube, buffer: BytesIO) -> None:
+    def __init__(self, youtube_object: "YouTube", buffer: bytearray) -> None:
         """
         Initialize an instance of the AudioDownloader class.
 
         Args:
             youtube_object (YouTube): A YouTube object representing the video.
-            buffer (BytesIO): A BytesIO buffer to store the downloaded audio.
+            buffer (bytearray): A buffer sized to the recognition window that
+            stores the beginning of the downloaded audio.
+            size: Number of bytes of the buffer holding audio.
             audio_segment: Initially set to None.
             It will hold the audio data segment once downloaded.
         """
         self.youtube_object = youtube_object
         self.buffer = buffer
+        self.size = 0
         self.audio_segment = None
 
     def download_audio(self) -> None:
         """
-        Download the audio from a YouTube video using the
+        Download the beginning of the audio from a YouTube video using the
         provided YouTube object and saves it to the buffer.
 
+        A single ranged request asks for no more than the buffer holds, so
+        the rest of the audio is never transferred.
+
         Raises:
             DownloadError: If an error occurs during audio download.
             YoutubeAudioNotFound: If no suitable audio stream is found.
         """
+        from pytube.exceptions import PytubeError
+
         try:
             if stream := self.youtube_object.streams.get_audio_only():
-                stream.stream_to_buffer(self.buffer)
+                request = Request(
+                    f"{stream.url}&range=0-{len(self.buffer) - 1}",
+                    headers=DOWNLOAD_HEADERS,
+                )
+                with urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+                    self.fill_buffer(response)
             else:
                 raise YoutubeAudioNotFound
-        except PytubeError as e:
+        except (PytubeError, OSError) as e:
             raise DownloadError(
                 f"An error occurred during audio download. {str(e)}"
             ) from e
 
-    def convert_to_audio_segment(self) -> AudioSegment:
+    def fill_buffer(self, source: BinaryIO) -> None:
+        """
+        Read the source straight into the buffer until it is full or the
+        source is exhausted.
+
+        Args:
+            source (BinaryIO): The audio data in download order.
+        """
+        view = memoryview(self.buffer)
+        while self.size < len(view):
+            read = source.readinto(view[self.size : self.size + READ_CHUNK_SIZE])
+            if not read:
+                break
+            self.size += read
+
+    def convert_to_audio_segment(self) -> "AudioSegment":
         """
-        Convert the downloaded audio into an AudioSegment
-        trimming it to the first 20 seconds.
+        Decode the downloaded audio into an AudioSegment
+        keeping only the recognition window.
+
+        The buffer is piped to ffmpeg without being copied.
 
         Returns:
             AudioSegment: An AudioSegment object containing the trimmed audio.
@@ -58,11 +104,38 @@ class YoutubeAudioDownloader:
         Raises:
             Exception: If an error occurs during the conversion or trimming.
         """
+        from pydub import AudioSegment
+
         try:
-            self.buffer.seek(0)
-            self.audio_segment = AudioSegment.from_file(self.buffer, "mp4")
-            self.audio_segment = self.audio_segment.get_sample_slice(
-                start_sample=0, end_sample=(20 * self.audio_segment.frame_rate)
+            decoded = subprocess.run(
+                [
+                    AudioSegment.converter,
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-i",
+                    "pipe:0",
+                    "-t",
+                    str(settings.RECOGNITION_WINDOW),
+                    "-f",
+                    "s16le",
+                    "-ac",
+                    str(AUDIO_CHANNELS),
+                    "-ar",
+                    str(AUDIO_FRAME_RATE),
+                    "pipe:1",
+                ],
+                input=memoryview(self.buffer)[: self.size],
+                capture_output=True,
+                check=True,
+            )
+            if not decoded.stdout:
+                raise ValueError("No audio decoded from the downloaded stream.")
+            self.audio_segment = AudioSegment(
+                data=decoded.stdout,
+                sample_width=AUDIO_SAMPLE_WIDTH,
+                frame_rate=AUDIO_FRAME_RATE,
+                channels=AUDIO_CHANNELS,
             )
         except Exception as e:
             logger.error(e)
@@ -73,7 +146,7 @@ class YoutubeMetadataTransformer:
     A class to transform YouTube video details into suitable metadata format.
     """
 
-    def __init__(self, youtube_object: YouTube) -> None:
+    def __init__(self, youtube_object: "YouTube") -> None:
         """
         Initialize the YoutubeMetadataTransformer instance.
 
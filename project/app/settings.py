@@ -1,4 +1,24 @@
 import os
+from typing import Dict, Tuple
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_clients(name: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Parse comma separated ``api_key=client:lane`` entries.
+    """
+    clients = {}
+    for entry in filter(None, os.environ.get(name, "").split(",")):
+        api_key, client = entry.strip().split("=", 1)
+        client_id, lane = client.split(":", 1)
+        clients[api_key] = (client_id, lane)
+    return clients
 
 
 class Settings:
@@ -7,5 +27,49 @@ class Settings:
     REDIS_TTL = 60 * 10  # seconds
     MAX_VIDEO_LENGTH = 60 * 10  # seconds
 
+    # Database engine profile
+    DB_ECHO = _env_bool("DB_ECHO", False)
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 20))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 30))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))  # seconds
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 60 * 30))  # seconds
+    DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+    DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", 500))
+
+    # Recognition scheduling
+    RECOGNITION_WORKERS = int(os.environ.get("RECOGNITION_WORKERS", 4))
+    RECOGNITION_INTERACTIVE_WEIGHT = int(
+        os.environ.get("RECOGNITION_INTERACTIVE_WEIGHT", 4)
+    )
+    RECOGNITION_INTERACTIVE_DEADLINE = int(
+        os.environ.get("RECOGNITION_INTERACTIVE_DEADLINE", 60 * 5)
+    )  # seconds
+    RECOGNITION_BULK_DEADLINE = int(
+        os.environ.get("RECOGNITION_BULK_DEADLINE", 60 * 60 * 6)
+    )  # seconds
+    RECOGNITION_INTERACTIVE_MAX_DEPTH = int(
+        os.environ.get("RECOGNITION_INTERACTIVE_MAX_DEPTH", 1000)
+    )
+    RECOGNITION_BULK_MAX_DEPTH = int(os.environ.get("RECOGNITION_BULK_MAX_DEPTH", 1000))
+    RECOGNITION_INTERACTIVE_CLIENT_LIMIT = int(
+        os.environ.get("RECOGNITION_INTERACTIVE_CLIENT_LIMIT", 5)
+    )
+    RECOGNITION_SHUTDOWN_TIMEOUT = int(
+        os.environ.get("RECOGNITION_SHUTDOWN_TIMEOUT", 30)
+    )  # seconds
+    RECOGNITION_CLIENTS = _env_clients("RECOGNITION_CLIENTS")
+
+    # Audio buffering
+    RECOGNITION_WINDOW = 20  # seconds
+    # Holds the compressed recognition window plus the container headers
+    AUDIO_BUFFER_SIZE = int(os.environ.get("AUDIO_BUFFER_SIZE", 1024 * 1024))
+    # Buffers are held while downloading and decoding only, the other workers
+    # recognize or save meanwhile, so half of them may hold one at a time
+    AUDIO_MEMORY_BUDGET = int(
+        os.environ.get(
+            "AUDIO_MEMORY_BUDGET", AUDIO_BUFFER_SIZE * max(RECOGNITION_WORKERS // 2, 1)
+        )
+    )
+
 
 settings = Settings()
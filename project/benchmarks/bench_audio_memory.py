@@ -0,0 +1,193 @@
+"""
+Peak RSS of concurrent audio jobs, with and without the buffer pool.
+
+Builds a 10-minute fragmented mp4 (the layout of YouTube audio streams)
+from the test data and serves it from a local HTTP server that honours the
+``range`` query parameter like the YouTube stream URLs. Then runs the
+download and decode step of many concurrent jobs against it.
+
+``legacy`` downloads the whole stream with ``pytube.request.stream`` into a
+``BytesIO`` and decodes all of it, as before. ``pooled`` runs the real
+``download_youtube_audio`` through the audio buffer pool. Each mode runs in
+its own process so their peak RSS does not mix. Requires ffmpeg.
+
+Usage:
+    python -m benchmarks.bench_audio_memory [--jobs 32] [--budget BYTES]
+"""
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlparse
+from pydub import AudioSegment
+from app.services.buffers import AudioBufferPool
+from app.services.service import download_youtube_audio
+from app.settings import settings
+
+SOURCE = os.path.join(os.path.dirname(__file__), "..", "tests", "data", "test_data.mp4")
+COPY_SIZE = 64 * 1024
+
+
+def build_input(path: str, duration: int) -> None:
+    subprocess.run(
+        [
+            AudioSegment.converter,
+            "-y",
+            "-loglevel",
+            "error",
+            "-stream_loop",
+            "-1",
+            "-i",
+            SOURCE,
+            "-t",
+            str(duration),
+            "-vn",
+            "-c:a",
+            "aac",
+            "-movflags",
+            "frag_keyframe+empty_moov",
+            path,
+        ],
+        check=True,
+    )
+
+
+def serve(path: str) -> ThreadingHTTPServer:
+    size = os.path.getsize(path)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            start, stop = 0, size - 1
+            if ranges := parse_qs(urlparse(self.path).query).get("range"):
+                start, stop = (int(position) for position in ranges[0].split("-"))
+                stop = min(stop, size - 1)
+            self.send_response(200)
+            self.send_header("Content-Length", str(stop - start + 1))
+            self.end_headers()
+            with open(path, "rb") as file:
+                file.seek(start)
+                remaining = stop - start + 1
+                try:
+                    while remaining > 0:
+                        chunk = file.read(min(COPY_SIZE, remaining))
+                        self.wfile.write(chunk)
+                        remaining -= len(chunk)
+                except ConnectionError:
+                    # pytube only reads the headers of its file size request
+                    pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class FakeStream:
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+
+class FakeStreams:
+    def __init__(self, url: str) -> None:
+        self.stream = FakeStream(url)
+
+    def get_audio_only(self) -> FakeStream:
+        return self.stream
+
+
+class FakeYouTube:
+    def __init__(self, url: str) -> None:
+        self.streams = FakeStreams(url)
+
+
+def legacy_job(url: str) -> AudioSegment:
+    from pytube import request
+
+    buffer = BytesIO()
+    for chunk in request.stream(url):
+        buffer.write(chunk)
+    buffer.seek(0)
+    audio_segment = AudioSegment.from_file(buffer, "mp4")
+    return audio_segment.get_sample_slice(
+        start_sample=0,
+        end_sample=settings.RECOGNITION_WINDOW * audio_segment.frame_rate,
+    )
+
+
+async def run(mode: str, path: str, jobs: int, budget: int) -> None:
+    server = serve(path)
+    url = f"http://127.0.0.1:{server.server_port}/videoplayback?id=bench"
+    pool = AudioBufferPool(settings.AUDIO_BUFFER_SIZE, budget)
+    waits = []
+
+    def timed(func, submitted, *args):
+        waits.append(time.perf_counter() - submitted)
+        return func(*args)
+
+    async def job():
+        submitted = time.perf_counter()
+        if mode == "legacy":
+            return await asyncio.to_thread(timed, legacy_job, submitted, url)
+        return await pool.run(
+            timed, download_youtube_audio, submitted, FakeYouTube(url)
+        )
+
+    start = time.perf_counter()
+    segments = await asyncio.gather(*(job() for _ in range(jobs)))
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    assert all(segments)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    capacity = pool.capacity if mode == "pooled" else "-"
+    print(
+        f"{mode:<7} jobs={jobs} buffers={capacity} time={elapsed:.2f}s "
+        f"wait mean={statistics.mean(waits):.2f}s max={max(waits):.2f}s "
+        f"peak RSS={max_rss / 1024:.1f}MB"
+    )
+
+
+def main(args) -> None:
+    if args.mode:
+        asyncio.run(run(args.mode, args.input, args.jobs, args.budget))
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "audio.mp4")
+        build_input(path, args.duration)
+        print(f"input: {args.duration}s, {os.path.getsize(path) / 1024 / 1024:.1f}MB")
+        for mode in ("legacy", "pooled"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.bench_audio_memory",
+                    "--mode",
+                    mode,
+                    "--input",
+                    path,
+                    "--jobs",
+                    str(args.jobs),
+                    "--budget",
+                    str(args.budget),
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=32)
+    parser.add_argument("--duration", type=int, default=60 * 10)  # seconds
+    parser.add_argument("--budget", type=int, default=settings.AUDIO_MEMORY_BUDGET)
+    parser.add_argument("--mode", choices=("legacy", "pooled"))
+    parser.add_argument("--input")
+    main(parser.parse_args())
@@ -0,0 +1,81 @@
+"""
+Benchmark the lookup path of the ``/url`` endpoint against the database.
+
+Compares the previous setup (``echo=True``, default pool, a new
+``sessionmaker`` per request) with the engine profile from ``app.db``.
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_db_sessions
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Callable, List, Tuple
+from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession, AsyncEngine
+from sqlalchemy.orm import sessionmaker
+from app.db import engine, read_only_session
+from app.models import YoutubeMetadata, ShazamMetadata
+from app.settings import settings
+
+
+def legacy_session_factory() -> Tuple[Callable[[], AsyncSession], AsyncEngine]:
+    legacy_engine = AsyncEngine(
+        create_engine(settings.DATABASE_URL, echo=True, future=True)
+    )
+
+    def factory() -> AsyncSession:
+        # Mirrors the old get_session: a new sessionmaker on every request
+        return sessionmaker(
+            legacy_engine, class_=AsyncSession, expire_on_commit=False
+        )()
+
+    return factory, legacy_engine
+
+
+async def lookup(factory: Callable[[], AsyncSession], video_id: str) -> float:
+    start = time.perf_counter()
+    async with factory() as session:
+        await session.get(YoutubeMetadata, video_id)
+        await session.get(ShazamMetadata, video_id)
+    return time.perf_counter() - start
+
+
+async def run(factory: Callable[[], AsyncSession], concurrency: int) -> List[float]:
+    return await asyncio.gather(
+        *(lookup(factory, f"bench-{i}") for i in range(concurrency))
+    )
+
+
+def report(name: str, wall: float, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:<8} wall={wall:.3f}s "
+        f"p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p99={p99 * 1000:.1f}ms "
+        f"rps={len(latencies) / wall:.0f}"
+    )
+
+
+async def main(concurrency: int) -> None:
+    logging.basicConfig()
+    legacy, legacy_engine = legacy_session_factory()
+    for name, factory, bench_engine in (
+        ("legacy", legacy, legacy_engine),
+        ("tuned", read_only_session, engine),
+    ):
+        await run(factory, min(concurrency, 10))  # warm up the pool
+        start = time.perf_counter()
+        latencies = await run(factory, concurrency)
+        report(name, time.perf_counter() - start, latencies)
+        await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))
@@ -0,0 +1,100 @@
+"""
+Mixed-workload benchmark for the recognition scheduler.
+
+A bulk backfill saturates the workers while interactive users keep
+arriving. Reports the interactive latency (submit to completion) of the
+priority scheduler against a plain FIFO queue, as ``BackgroundTasks``
+behaved before.
+
+Usage:
+    python -m benchmarks.bench_scheduler [--bulk 500] [--interactive 50]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+from app.services.scheduler import Lane, RecognitionScheduler
+
+
+async def fake_recognition(duration: float) -> None:
+    await asyncio.sleep(duration)
+
+
+def report(name: str, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    print(
+        f"{name:<10} interactive p50={statistics.median(latencies) * 1000:.0f}ms "
+        f"p99={p99 * 1000:.0f}ms max={latencies[-1] * 1000:.0f}ms"
+    )
+
+
+async def run_fifo(args) -> List[float]:
+    queue = asyncio.Queue()
+    latencies = []
+
+    async def worker():
+        while True:
+            submitted, interactive = await queue.get()
+            await fake_recognition(args.job_time)
+            if interactive:
+                latencies.append(time.monotonic() - submitted)
+            queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(args.workers)]
+    for _ in range(args.bulk):
+        queue.put_nowait((time.monotonic(), False))
+    for _ in range(args.interactive):
+        queue.put_nowait((time.monotonic(), True))
+        await asyncio.sleep(args.arrival)
+    await queue.join()
+    for task in workers:
+        task.cancel()
+    return latencies
+
+
+async def run_scheduler(args) -> List[float]:
+    scheduler = RecognitionScheduler(
+        workers=args.workers,
+        interactive_weight=4,
+        deadlines={Lane.INTERACTIVE: 60 * 5, Lane.BULK: 60 * 60 * 6},
+        max_depths={Lane.INTERACTIVE: args.interactive, Lane.BULK: args.bulk},
+        interactive_client_limit=5,
+    )
+    latencies = []
+
+    def job(interactive: bool):
+        submitted = time.monotonic()
+
+        async def run():
+            await fake_recognition(args.job_time)
+            if interactive:
+                latencies.append(time.monotonic() - submitted)
+
+        return run
+
+    scheduler.start()
+    for i in range(args.bulk):
+        scheduler.submit(job(False), f"bulk-{i}", "backfill", Lane.BULK)
+    for i in range(args.interactive):
+        scheduler.submit(job(True), f"user-{i}", f"user-{i % 10}")
+        await asyncio.sleep(args.arrival)
+    await scheduler.join()
+    await scheduler.stop(timeout=1)
+    return latencies
+
+
+async def main(args) -> None:
+    report("fifo", await run_fifo(args))
+    report("scheduler", await run_scheduler(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--bulk", type=int, default=500)
+    parser.add_argument("--interactive", type=int, default=50)
+    parser.add_argument("--job-time", type=float, default=0.02)  # seconds
+    parser.add_argument("--arrival", type=float, default=0.01)  # seconds
+    asyncio.run(main(parser.parse_args()))
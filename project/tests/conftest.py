@@ -1,3 +1,4 @@
+import subprocess
 import pytest
 from pydub import AudioSegment
 
@@ -5,3 +6,33 @@ from pydub import AudioSegment
 @pytest.fixture
 def audio_file_to_segment():
     return AudioSegment.from_file("tests/data/test_data.mp4")
+
+
+@pytest.fixture
+def fragmented_audio_prefix(tmp_path):
+    """
+    The beginning of a one minute fragmented mp4, the layout of YouTube audio
+    streams, looped from the test data.
+    """
+    path = tmp_path / "fragmented.mp4"
+    subprocess.run(
+        [
+            AudioSegment.converter,
+            "-loglevel",
+            "error",
+            "-stream_loop",
+            "-1",
+            "-i",
+            "tests/data/test_data.mp4",
+            "-t",
+            "60",
+            "-vn",
+            "-c:a",
+            "aac",
+            "-movflags",
+            "frag_keyframe+empty_moov",
+            str(path),
+        ],
+        check=True,
+    )
+    return path.read_bytes()[: 512 * 1024]
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from io import BytesIO
+import pytest
+from app.services.buffers import AudioBufferPool
+from app.services.youtube import YoutubeAudioDownloader
+
+
+def blocking(event, buffer):
+    event.wait()
+    return buffer
+
+
+@pytest.mark.asyncio
+async def test_buffers_are_reused():
+    pool = AudioBufferPool(buffer_size=16, memory_budget=64)
+    first = await pool.run(lambda buffer: buffer)
+    second = await pool.run(lambda buffer: buffer)
+    assert second is first
+    assert len(second) == 16
+
+
+@pytest.mark.asyncio
+async def test_jobs_wait_when_budget_is_exhausted():
+    pool = AudioBufferPool(buffer_size=16, memory_budget=32)
+    assert pool.capacity == 2
+    event = threading.Event()
+    running = [asyncio.create_task(pool.run(blocking, event)) for _ in range(2)]
+    waiting = asyncio.create_task(pool.run(lambda buffer: buffer))
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+    event.set()
+    buffers = await asyncio.gather(*running)
+    assert await waiting in buffers
+
+
+@pytest.mark.asyncio
+async def test_buffer_is_released_after_cancelled_thread_finishes():
+    pool = AudioBufferPool(buffer_size=16, memory_budget=16)
+    event = threading.Event()
+    cancelled = asyncio.create_task(pool.run(blocking, event))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    waiting = asyncio.create_task(pool.run(lambda buffer: buffer))
+    await asyncio.sleep(0.05)
+    assert cancelled.cancelled()
+    assert not waiting.done()
+    event.set()
+    assert len(await waiting) == 16
+
+
+def test_fill_buffer_stops_at_buffer_size():
+    downloader = YoutubeAudioDownloader(None, bytearray(10))
+    downloader.fill_buffer(BytesIO(b"abcdefghijklmnopqr"))
+    assert downloader.size == 10
+    assert downloader.buffer == b"abcdefghij"
@@ -1,9 +1,26 @@
 import pytest
+from io import BytesIO
+from app.exceptions import DownloadError
 from app.services.service import download_youtube_audio
+from app.services.youtube import YoutubeAudioDownloader
+from app.settings import settings
 from pytube import YouTube
 from pydub import AudioSegment
 
 
+class FakeStream:
+    url = "https://example.com/videoplayback?id=test"
+
+
+class FakeStreams:
+    def get_audio_only(self):
+        return FakeStream()
+
+
+class FakeYouTube:
+    streams = FakeStreams()
+
+
 @pytest.mark.parametrize(
     "youtube_url",
     [
@@ -27,3 +44,38 @@ def test_download_youtube_audio_failure(youtube_url):
     youtube_object = YouTube(youtube_url)
     result = download_youtube_audio(youtube_object)
     assert result, None
+
+
+def test_download_audio_requests_buffer_range(monkeypatch):
+    requests = []
+
+    def fake_urlopen(request, timeout):
+        requests.append(request)
+        return BytesIO(b"audio" * 10)
+
+    monkeypatch.setattr("app.services.youtube.urlopen", fake_urlopen)
+    downloader = YoutubeAudioDownloader(FakeYouTube(), bytearray(16))
+    downloader.download_audio()
+    assert requests[0].full_url.endswith("&range=0-15")
+    assert downloader.size == 16
+    assert downloader.buffer == b"audioaudioaudioa"
+
+
+def test_download_audio_network_error(monkeypatch):
+    def fake_urlopen(request, timeout):
+        raise OSError("Connection reset")
+
+    monkeypatch.setattr("app.services.youtube.urlopen", fake_urlopen)
+    downloader = YoutubeAudioDownloader(FakeYouTube(), bytearray(16))
+    with pytest.raises(DownloadError):
+        downloader.download_audio()
+
+
+def test_convert_fragmented_prefix_to_audio_segment(fragmented_audio_prefix):
+    downloader = YoutubeAudioDownloader(FakeYouTube(), bytearray(1024 * 1024))
+    downloader.fill_buffer(BytesIO(fragmented_audio_prefix))
+    downloader.convert_to_audio_segment()
+    audio_segment = downloader.audio_segment
+    assert audio_segment.frame_rate == 16000
+    assert audio_segment.channels == 1
+    assert 0 < audio_segment.duration_seconds <= settings.RECOGNITION_WINDOW
@@ -0,0 +1,27 @@
+import pytest
+from benchmarks.bench_import_time import (
+    HEAVY_MODULES,
+    IMPORT_TIME_BUDGET,
+    compare_with_baseline,
+    measure_import,
+)
+
+
+@pytest.fixture(scope="module")
+def api_modules():
+    _, modules, _ = measure_import("app.main")
+    return modules
+
+
+@pytest.fixture(scope="module")
+def api_import_ratio():
+    total, baseline = compare_with_baseline("app.main", repeat=5)
+    return total / baseline
+
+
+def test_api_does_not_import_media_stack(api_modules):
+    assert not [name for name in HEAVY_MODULES if name in api_modules]
+
+
+def test_api_import_time_within_budget(api_import_ratio):
+    assert api_import_ratio < IMPORT_TIME_BUDGET
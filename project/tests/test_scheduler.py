@@ -0,0 +1,136 @@
+import asyncio
+import pytest
+from app.exceptions import RecognitionQueueFull
+from app.services.scheduler import Lane, RecognitionScheduler
+
+
+def make_scheduler(interactive_deadline=60, bulk_deadline=60, max_depth=100):
+    return RecognitionScheduler(
+        workers=1,
+        interactive_weight=2,
+        deadlines={Lane.INTERACTIVE: interactive_deadline, Lane.BULK: bulk_deadline},
+        max_depths={Lane.INTERACTIVE: max_depth, Lane.BULK: max_depth},
+        interactive_client_limit=2,
+    )
+
+
+def submit(scheduler, order, video_id, client_id, lane):
+    async def run():
+        order.append(video_id)
+
+    return scheduler.submit(run, video_id=video_id, client_id=client_id, lane=lane)
+
+
+@pytest.mark.asyncio
+async def test_interactive_lane_runs_before_bulk():
+    scheduler = make_scheduler()
+    order = []
+    for i in range(3):
+        submit(scheduler, order, f"bulk-{i}", "backfill", Lane.BULK)
+    for i in range(3):
+        submit(scheduler, order, f"interactive-{i}", f"user-{i}", Lane.INTERACTIVE)
+    scheduler.start()
+    await scheduler.join()
+    await scheduler.stop(timeout=1)
+    assert order == [
+        "interactive-0",
+        "interactive-1",
+        "bulk-0",
+        "interactive-2",
+        "bulk-1",
+        "bulk-2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_clients_are_served_fairly():
+    scheduler = make_scheduler()
+    order = []
+    for i in range(3):
+        submit(scheduler, order, f"a-{i}", "a", Lane.BULK)
+    submit(scheduler, order, "b-0", "b", Lane.BULK)
+    scheduler.start()
+    await scheduler.join()
+    await scheduler.stop(timeout=1)
+    assert order == ["a-0", "b-0", "a-1", "a-2"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_jobs_are_skipped_and_bulk_promoted():
+    scheduler = make_scheduler()
+    order = []
+    assert submit(scheduler, order, "video", "backfill", Lane.BULK)
+    assert not submit(scheduler, order, "video", "backfill", Lane.BULK)
+    submit(scheduler, order, "other", "backfill", Lane.BULK)
+    assert submit(scheduler, order, "video", "user", Lane.INTERACTIVE)
+    scheduler.start()
+    await scheduler.join()
+    await scheduler.stop(timeout=1)
+    assert order == ["video", "other"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_job_is_kept_when_interactive_lane_is_full():
+    scheduler = make_scheduler(max_depth=1)
+    order = []
+    submit(scheduler, order, "video", "backfill", Lane.BULK)
+    submit(scheduler, order, "other", "user", Lane.INTERACTIVE)
+    assert not submit(scheduler, order, "video", "user", Lane.INTERACTIVE)
+    scheduler.start()
+    await scheduler.join()
+    await scheduler.stop(timeout=1)
+    assert order == ["other", "video"]
+
+
+@pytest.mark.asyncio
+async def test_expired_jobs_are_dropped():
+    scheduler = make_scheduler(interactive_deadline=-1)
+    order = []
+    submit(scheduler, order, "expired", "user", Lane.INTERACTIVE)
+    submit(scheduler, order, "bulk", "backfill", Lane.BULK)
+    scheduler.start()
+    await scheduler.join()
+    await scheduler.stop(timeout=1)
+    assert order == ["bulk"]
+
+
+@pytest.mark.asyncio
+async def test_full_lane_rejects_jobs():
+    scheduler = make_scheduler(max_depth=1)
+    order = []
+    submit(scheduler, order, "first", "backfill", Lane.BULK)
+    with pytest.raises(RecognitionQueueFull):
+        submit(scheduler, order, "second", "backfill", Lane.BULK)
+
+
+@pytest.mark.asyncio
+async def test_busy_interactive_client_is_moved_to_bulk():
+    scheduler = make_scheduler()
+    order = []
+    for i in range(3):
+        submit(scheduler, order, f"script-{i}", "script", Lane.INTERACTIVE)
+    submit(scheduler, order, "user-0", "user", Lane.INTERACTIVE)
+    scheduler.start()
+    await scheduler.join()
+    await scheduler.stop(timeout=1)
+    assert order == ["script-0", "user-0", "script-2", "script-1"]
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_running_jobs_and_abandons_queued(caplog):
+    scheduler = make_scheduler()
+    order = []
+    started = asyncio.Event()
+
+    async def running():
+        started.set()
+        await asyncio.sleep(0.01)
+        order.append("running")
+
+    scheduler.submit(running, video_id="running", client_id="user")
+    submit(scheduler, order, "queued", "user", Lane.INTERACTIVE)
+    scheduler.start()
+    await started.wait()
+    await scheduler.stop(timeout=1)
+    assert order == ["running"]
+    assert "Abandoned 1 queued recognition jobs" in caplog.text